@@ -33,42 +33,42 @@ class ListType(TypeData):
         """
         if not value:
             return []
-        values = [i.strip() for i in value.splitlines() if i.strip()]
-        if not values:
-            values = [i.strip() for i in value.split(',') if i.strip()]
-        return values
+        # splitlines knows every line separator (\r, \r\n, ...), only fall back to commas for a single line
+        lines = value.splitlines()
+        parts = lines if len(lines) > 1 else value.split(',')
+        return [i for i in map(str.strip, parts) if i]
+
+def _to_bool(value):
+    if isinstance(value, str):
+        result = BoolType.BOOLEAN_STATES.get(value.lower())
+        if result is None:
+            msg = f'invalid truth value {value.lower()!r}'
+            raise ValueError(msg)
+        return result
+    return bool(value)
 
 def convert(value, as_type, source):
     """Convert the value as a given type where the value comes from the given source."""
     if value is None or isinstance(value, as_type):
         return value
+    if as_type is type(None):
+        return None
     try:
-        if as_type == bool:
-            if isinstance(value, str):
-                value = value.lower()
-                if value not in BoolType.BOOLEAN_STATES:
-                    msg = f'invalid truth value {value!r}'
-                    raise ValueError(msg)
-                return BoolType.BOOLEAN_STATES[value]
-            return bool(value)
-        if as_type == list:
+        if as_type is bool:
+            return _to_bool(value)
+        if as_type is list:
             if isinstance(value, str):
                 value = ListType(list, as_type).split_values(value)
             return list(value)
-        if as_type == type(None):
-            return None
         return as_type(value)
-    except Exception as exception:
+    except (ValueError, TypeError) as exception:
         logging.error('failed to convert %r to %r from %r because %r', value, as_type, source, exception)
         raise
 
 def get_type(value):
     """Get type information for a value."""
     as_type = type(value)
-    for key, class_type in _CONVERT.items():
-        if as_type is key:
-            return class_type(as_type, as_type)
-    return TypeData(as_type, as_type)
+    return _CONVERT.get(as_type, TypeData)(as_type, as_type)
 
 _CONVERT = {bool: BoolType, type(None): NoneType, list: ListType}
 __all__ = ['convert', 'get_type']
\ No newline at end of file
@@ -6,7 +6,6 @@ import sys
 from abc import ABC, abstractmethod
 from argparse import ArgumentTypeError
 from ast import literal_eval
-from collections import OrderedDict
 from pathlib import Path
 from virtualenv.discovery.cached_py_info import LogCmd
 from virtualenv.util.path import safe_delete
@@ -15,6 +14,11 @@ from virtualenv.version import __version__
 from .pyenv_cfg import PyEnvCfg
 HERE = Path(os.path.abspath(__file__)).parent
 DEBUG_SCRIPT = HERE / 'debug.py'
+_VCS_IGNORE = (
+    ('.gitignore', '# created by virtualenv automatically\n*\n'),
+    ('.hgignore', 'syntax:glob\n# created by virtualenv automatically\n*\n'),
+)
+_CREATE_NEW_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
 
 class CreatorMeta:
 
@@ -116,13 +120,14 @@ class Creator(ABC):
         """Generate ignore instructions for version control systems."""
         if self.no_vcs_ignore:
             return
-        for ignore_file, content in [
-            ('.gitignore', '# created by virtualenv automatically\n*\n'),
-            ('.hgignore', 'syntax:glob\n# created by virtualenv automatically\n*\n'),
-        ]:
-            path = self.dest / ignore_file
-            if not path.exists():
-                path.write_text(content, encoding='utf-8')
+        for ignore_file, content in _VCS_IGNORE:
+            # create exclusively: a single open both checks for an existing file and creates the new one
+            try:
+                fd = os.open(self.dest / ignore_file, _CREATE_NEW_FLAGS, 0o644)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, 'w', encoding='utf-8') as file_handler:
+                file_handler.write(content)
 
     @property
     def debug(self):
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import logging
 import os
-from collections import OrderedDict
+
+# parsed content of the configuration files read so far, keyed by path and tagged with the file identity and state
+_CONTENT_CACHE = {}
 
 class PyEnvCfg:
 
@@ -9,6 +11,56 @@ class PyEnvCfg:
         self.content = content
         self.path = path
 
+    @classmethod
+    def from_folder(cls, folder):
+        """Load the configuration of the virtual environment within a folder."""
+        return cls.from_file(folder / 'pyvenv.cfg')
+
+    @classmethod
+    def from_file(cls, path):
+        """Load the configuration from a file, re-using the parsed content while the file is unchanged on disk."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return cls({}, path)
+        # a rewrite within one timestamp tick keeps the modification time, but rarely the size and inode as well
+        tag = stat.st_mtime_ns, stat.st_size, stat.st_ino
+        key = os.fspath(path)
+        cached = _CONTENT_CACHE.get(key)
+        if cached is None or cached[0] != tag:
+            cached = _CONTENT_CACHE[key] = tag, cls._read_values(path)
+        return cls(dict(cached[1]), path)
+
+    @staticmethod
+    def _read_values(path):
+        content = {}
+        for line in path.read_text(encoding='utf-8').splitlines():
+            equals_at = line.index('=')
+            key = line[:equals_at].strip()
+            value = line[equals_at + 1:].strip()
+            content[key] = value
+        return content
+
+    def write(self):
+        """Write the configuration to disk."""
+        logging.debug('write %s', self.path)
+        text = ''
+        for key, value in self.content.items():
+            normalized_value = os.path.realpath(value) if value and os.path.exists(value) else value
+            line = f'{key} = {normalized_value}'
+            logging.debug('\t%s', line)
+            text += line
+            text += '\n'
+        self.path.write_text(text, encoding='utf-8')
+        # the modification time may not change within the timer resolution, so drop the stale entry explicitly
+        _CONTENT_CACHE.pop(os.fspath(self.path), None)
+
+    def refresh(self):
+        """Re-read the configuration from disk."""
+        _CONTENT_CACHE.pop(os.fspath(self.path), None)
+        self.content = self.from_file(self.path).content
+        return self.content
+
     def __setitem__(self, key, value) -> None:
         self.content[key] = value
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 import os
+import sys
 from pathlib import Path
 
+_STORE_PREFIX = os.path.expandvars('%LOCALAPPDATA%\\Microsoft\\WindowsApps') if sys.platform == 'win32' else None
+
 def is_store_python(interpreter):
-    """Check if the interpreter is a Windows Store Python."""
-    if not interpreter.platform == 'win32':
+    """Check if the interpreter (or a path to an executable) is a Windows Store Python."""
+    if _STORE_PREFIX is None:
         return False
-    return str(interpreter.executable).startswith(os.path.expandvars('%LOCALAPPDATA%\\Microsoft\\WindowsApps'))
+    if isinstance(interpreter, (str, os.PathLike)):
+        return os.fspath(interpreter).startswith(_STORE_PREFIX)
+    return interpreter.platform == 'win32' and str(interpreter.executable).startswith(_STORE_PREFIX)
 
 def handle_store_python(interpreter):
     """Handle Windows Store Python by finding the actual Python executable."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
 import os
+import stat
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
     from argparse import ArgumentParser
     from collections.abc import Generator, Iterable, Mapping, Sequence
     from virtualenv.app_data.base import AppData
+_EXECUTABLE = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
 
 class Builtin(Discover):
     python_spec: Sequence[str]
@@ -37,31 +39,49 @@ class LazyPathDump:
 
     def __repr__(self) -> str:
         content = f'discover PATH[{self.pos}]={self.path}'
-        if self.env.get('_VIRTUALENV_DEBUG'):
+        if self.env.get('_VIRTUALENV_DEBUG') and logging.getLogger().isEnabledFor(logging.DEBUG):
             content += ' with =>'
-            for file_path in self.path.iterdir():
+            for name in self.executables():
+                content += ' '
+                content += name
+        return content
+
+    def executables(self) -> Generator[str, None, None]:
+        """
+        List the executable files within the path.
+
+        Yields:
+            the name of each executable file
+        """
+        with os.scandir(self.path) as entries:
+            for entry in entries:
                 try:
-                    if file_path.is_dir() or not file_path.stat().st_mode & os.X_OK:
+                    if entry.is_dir() or not entry.stat().st_mode & _EXECUTABLE:
                         continue
                 except OSError:
                     pass
-                content += ' '
-                content += file_path.name
-        return content
+                yield entry.name
 
-def path_exe_finder(spec: PythonSpec) -> Callable[[Path], Generator[tuple[Path, bool], None, None]]:
+def path_exe_finder(spec: PythonSpec) -> Callable[[str], Generator[tuple[str, bool], None, None]]:
     """Given a spec, return a function that can be called on a path to find all matching files in it."""
-    pattern = spec.generate_re(windows=IS_WIN)
+    match = spec.generate_re(windows=IS_WIN).fullmatch
+    # candidates start with one of these names (in any case), checking the first character rejects most entries early
+    impls = ('python',) if spec.implementation is None else ('python', spec.implementation)
+    initials = frozenset(case(impl[:1]) for impl in impls for case in (str.lower, str.upper))
 
-    def finder(path: Path) -> Generator[tuple[Path, bool], None, None]:
-        for file_path in path.iterdir():
-            try:
-                if file_path.is_dir() or not file_path.stat().st_mode & os.X_OK:
+    def finder(path: str) -> Generator[tuple[str, bool], None, None]:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # the name check is free, so only stat the few entries that could be an interpreter
+                name = entry.name
+                if name[:1] not in initials or not match(name):
+                    continue
+                try:
+                    if entry.is_dir() or not entry.stat().st_mode & _EXECUTABLE:
+                        continue
+                except OSError:
                     continue
-            except OSError:
-                continue
-            if pattern.match(file_path.name):
-                yield file_path, True
+                yield entry.path, True
     return finder
 
 def get_interpreter(app_data, spec, env=None):
@@ -75,12 +95,12 @@ def get_interpreter(app_data, spec, env=None):
         return None
 
     # Search in PATH
-    paths = [Path(i) for i in env.get('PATH', '').split(os.pathsep) if i]
+    paths = [i for i in env.get('PATH', '').split(os.pathsep) if i]
     finder = path_exe_finder(spec)
     for path in paths:
         try:
             for exe, strict in finder(path):
-                info = PythonInfo.from_exe(exe, app_data=app_data, env=env)
+                info = PythonInfo.from_exe(Path(exe), app_data=app_data, env=env)
                 if info is not None and info.satisfies(spec, strict):
                     return info
         except OSError:
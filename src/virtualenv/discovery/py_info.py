@@ -4,16 +4,11 @@ The PythonInfo contains information about a concrete instance of a Python interp
 Note: this file is also used to query target interpreters, so can only use standard library methods
 """
 from __future__ import annotations
-import json
 import logging
 import os
-import platform
-import re
 import sys
-import sysconfig
-import warnings
-from collections import OrderedDict, namedtuple
-from string import digits
+from collections import namedtuple
+from string import Formatter, digits
 
 def _get_path_extensions():
     """Get the executable path extensions from the PATHEXT environment variable."""
@@ -24,12 +19,14 @@ def _get_path_extensions():
 
 VersionInfo = namedtuple('VersionInfo', ['major', 'minor', 'micro', 'releaselevel', 'serial'])
 EXTENSIONS = _get_path_extensions()
-_CONF_VAR_RE = re.compile('\\{\\w+\\}')
+_FORMATTER = Formatter()
 
 class PythonInfo:
     """Contains information for a Python interpreter."""
 
     def __init__(self) -> None:
+        import platform
+        import sysconfig
 
         def abs_path(v):
             return None if v is None else os.path.abspath(v)
@@ -60,52 +57,61 @@ class PythonInfo:
         self.path = sys.path
         self.file_system_encoding = sys.getfilesystemencoding()
         self.stdout_encoding = getattr(sys.stdout, 'encoding', None)
+        scheme, paths, distutils_install, makefile_info, config_vars = self._host_sysconfig()
+        self.sysconfig_scheme = scheme
+        self.sysconfig_paths = dict(paths)
+        self.distutils_install = dict(distutils_install)
+        self.sysconfig = dict(makefile_info)
+        self.sysconfig_vars = dict(config_vars)
+        confs = {k: self.system_prefix if v is not None and v.startswith(self.prefix) else v for k, v in self.sysconfig_vars.items()}
+        self.system_stdlib = self.sysconfig_path('stdlib', confs)
+        self.system_stdlib_platform = self.sysconfig_path('platstdlib', confs)
+        self.max_size = getattr(sys, 'maxsize', getattr(sys, 'maxint', None))
+        self._creators = None
+
+    _host_sysconfig_cache = None
+
+    @classmethod
+    def _host_sysconfig(cls):
+        """Query the sysconfig layout of the running interpreter, memoized until :meth:`clear_cache`."""
+        import sysconfig
+
+        if cls._host_sysconfig_cache is not None and cls._host_sysconfig_cache[0] == sys.executable:
+            return cls._host_sysconfig_cache[1]
         scheme_names = sysconfig.get_scheme_names()
         if 'venv' in scheme_names:
-            self.sysconfig_scheme = 'venv'
-            self.sysconfig_paths = {i: sysconfig.get_path(i, expand=False, scheme=self.sysconfig_scheme) for i in sysconfig.get_path_names()}
-            self.distutils_install = {}
+            scheme = 'venv'
+            paths = {i: sysconfig.get_path(i, expand=False, scheme=scheme) for i in sysconfig.get_path_names()}
+            distutils_install = {}
         elif sys.version_info[:2] == (3, 10) and 'deb_system' in scheme_names:
-            self.sysconfig_scheme = 'posix_prefix'
-            self.sysconfig_paths = {i: sysconfig.get_path(i, expand=False, scheme=self.sysconfig_scheme) for i in sysconfig.get_path_names()}
-            self.distutils_install = {}
+            scheme = 'posix_prefix'
+            paths = {i: sysconfig.get_path(i, expand=False, scheme=scheme) for i in sysconfig.get_path_names()}
+            distutils_install = {}
         else:
-            self.sysconfig_scheme = None
-            self.sysconfig_paths = {i: sysconfig.get_path(i, expand=False) for i in sysconfig.get_path_names()}
-            self.distutils_install = self._distutils_install().copy()
+            scheme = None
+            paths = {i: sysconfig.get_path(i, expand=False) for i in sysconfig.get_path_names()}
+            distutils_install = cls._distutils_install().copy()
         makefile = getattr(sysconfig, 'get_makefile_filename', getattr(sysconfig, '_get_makefile_filename', None))
-        self.sysconfig = {k: v for k, v in [('makefile_filename', makefile())] if k is not None}
-        config_var_keys = set()
-        for element in self.sysconfig_paths.values():
-            config_var_keys.update((k[1:-1] for k in _CONF_VAR_RE.findall(element)))
+        makefile_info = {k: v for k, v in [('makefile_filename', makefile())] if k is not None}
+        config_var_keys = {name for template in paths.values() for _, name, _, _ in _FORMATTER.parse(template) if name}
         config_var_keys.add('PYTHONFRAMEWORK')
-        self.sysconfig_vars = {i: sysconfig.get_config_var(i or '') for i in config_var_keys}
-        confs = {k: self.system_prefix if v is not None and v.startswith(self.prefix) else v for k, v in self.sysconfig_vars.items()}
-        self.system_stdlib = self.sysconfig_path('stdlib', confs)
-        self.system_stdlib_platform = self.sysconfig_path('platstdlib', confs)
-        self.max_size = getattr(sys, 'maxsize', getattr(sys, 'maxint', None))
-        self._creators = None
+        config_vars = {i: sysconfig.get_config_var(i or '') for i in config_var_keys}
+        result = scheme, paths, distutils_install, makefile_info, config_vars
+        cls._host_sysconfig_cache = sys.executable, result
+        return result
 
     def _fast_get_system_executable(self):
         """Try to get the system executable by just looking at properties."""
-        if self.base_prefix is None and self.base_exec_prefix is None:
-            return self.executable
-        if self.real_prefix is not None:
-            return self.executable
-        if self.prefix != self.base_prefix and self.base_prefix is not None:
-            return None
-        if self.exec_prefix != self.base_exec_prefix and self.base_exec_prefix is not None:
-            return None
-        return self.executable
+        # a venv (but not an old-style virtualenv, which sets real_prefix) differs from its base prefixes
+        in_venv = (self.base_prefix is not None and self.prefix != self.base_prefix) or (
+            self.base_exec_prefix is not None and self.exec_prefix != self.base_exec_prefix
+        )
+        return None if in_venv and self.real_prefix is None else self.executable
 
     def sysconfig_path(self, key, config_vars=None):
         """Get a path from sysconfig with optional config vars."""
         pattern = self.sysconfig_paths.get(key)
-        if pattern is None:
-            return None
-        if config_vars is None:
-            config_vars = self.sysconfig_vars
-        return pattern.format(**config_vars) if pattern else None
+        return pattern.format_map(self.sysconfig_vars if config_vars is None else config_vars) if pattern else None
 
     def __repr__(self) -> str:
         return '{}({!r})'.format(self.__class__.__name__, {k: v for k, v in self.__dict__.items() if not k.startswith('_')})
@@ -124,7 +130,7 @@ class PythonInfo:
     def creators(self):
         """Get the list of available virtual environment creators."""
         if self._creators is None:
-            from virtualenv.run.plugin.creators import CreatorSelector
+            from virtualenv.run.plugin.creators import CreatorSelector  # noqa: PLC0415 # creators import this module
             self._creators = CreatorSelector.for_interpreter(self)
         return self._creators
 
@@ -134,10 +140,12 @@ class PythonInfo:
             return False
         if spec.architecture is not None and spec.architecture != self.architecture:
             return False
-        for our, req in zip(self.version_info[0:3], (spec.major, spec.minor, spec.micro)):
-            if req is not None and our is not None and our != req:
-                return False
-        return True
+        version_info = self.version_info
+        if spec.major is not None and version_info.major != spec.major:
+            return False
+        if spec.minor is not None and version_info.minor != spec.minor:
+            return False
+        return spec.micro is None or version_info.micro == spec.micro
 
     _current_system = None
     _current = None
@@ -166,8 +174,10 @@ class PythonInfo:
     def from_exe(cls, exe, app_data=None, raise_on_error=True, ignore_cache=False, resolve_to_host=True, env=None):
         """Given a path to an executable get the python information."""
         # First, check if we have this information cached
-        if not ignore_cache and exe in cls._cache_exe_discovery:
-            result = cls._cache_exe_discovery[exe]
+        key = cls._exe_cache_key(exe)
+        if not ignore_cache and key in cls._cache_exe_discovery:
+            # re-insert to mark the entry as the most recently used one
+            result = cls._cache_exe_discovery[key] = cls._cache_exe_discovery.pop(key)
             if result is not None or not raise_on_error:
                 return result
             msg = f'failed to get interpreter info for {exe}'
@@ -177,15 +187,43 @@ class PythonInfo:
         try:
             info = cls()
             info.executable = exe
-            cls._cache_exe_discovery[exe] = info
+            cls._cache_exe(key, info)
             return info
         except Exception as exception:
-            cls._cache_exe_discovery[exe] = None
+            cls._cache_exe(key, None)
             if raise_on_error:
                 raise
             logging.error('failed to get interpreter info for %s because %r', exe, exception)
             return None
+
+    @classmethod
+    def clear_cache(cls, app_data=None):  # noqa: ARG003
+        """Forget the interpreters discovered, their creators and the host sysconfig layout queried so far."""
+        from virtualenv.run.plugin.creators import CreatorSelector  # noqa: PLC0415 # creators import this module
+
+        cls._cache_exe_discovery.clear()
+        cls._host_sysconfig_cache = None
+        CreatorSelector.clear_cache()
+
+    @staticmethod
+    def _exe_cache_key(exe):
+        """Identify an executable by its normalized path and modification time, so aliases share an entry."""
+        from virtualenv.info import fs_path_id
+
+        path = os.fspath(exe)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        return fs_path_id(path), mtime
+
+    @classmethod
+    def _cache_exe(cls, key, info):
+        cls._cache_exe_discovery[key] = info
+        if len(cls._cache_exe_discovery) > cls._cache_exe_max_size:
+            del cls._cache_exe_discovery[next(iter(cls._cache_exe_discovery))]
     _cache_exe_discovery = {}
+    _cache_exe_max_size = 64
 if __name__ == '__main__':
     argv = sys.argv[1:]
     if len(argv) >= 1:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import os
 import re
+from functools import lru_cache
 PATTERN = re.compile('^(?P<impl>[a-zA-Z]+)?(?P<version>[0-9.]+)?(?:-(?P<arch>32|64))?$')
 
 class PythonSpec:
@@ -18,7 +19,7 @@ class PythonSpec:
 
     def generate_re(self, *, windows: bool) -> re.Pattern:
         """Generate a regular expression for matching against a filename."""
-        pass
+        return _generate_re(self.implementation, self.major, self.minor, self.micro, windows=windows)
 
     def satisfies(self, spec):
         """Called when there's a candidate metadata spec to see if compatible - e.g. PEP-514 on Windows."""
@@ -29,4 +30,16 @@ class PythonSpec:
         params = ('implementation', 'major', 'minor', 'micro', 'architecture', 'path')
         items = [f'{k}={getattr(self, k)}' for k in params if getattr(self, k) is not None]
         return f'{name}({", ".join(items)})'
+
+@lru_cache(maxsize=128)
+def _generate_re(implementation, major, minor, micro, *, windows):
+    """Compile the filename pattern for the given spec fields, shared by all specs with the same fields."""
+    version = '{}(\\.{}(\\.{})?)?'.format(*('\\d+' if v is None else v for v in (major, minor, micro)))
+    impl = 'python' if implementation is None else f'python|{re.escape(implementation)}'
+    suffix = '\\.exe' if windows else ''
+    # Windows Python executables are almost always unversioned, and an empty spec matches any version
+    version_conditional = '?' if windows or major is None else ''
+    # file names on Windows are case-insensitive ASCII, which lets the engine skip Unicode case folding
+    flags = re.IGNORECASE | re.ASCII if windows else re.IGNORECASE
+    return re.compile(f'(?P<impl>{impl})(?P<v>{version}){version_conditional}{suffix}$', flags=flags)
 __all__ = ['PythonSpec']
\ No newline at end of file
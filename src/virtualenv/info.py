@@ -4,12 +4,14 @@ import os
 import platform
 import sys
 import tempfile
+from functools import lru_cache
 
 IMPLEMENTATION = platform.python_implementation()
 IS_PYPY = IMPLEMENTATION == 'PyPy'
 IS_CPYTHON = IMPLEMENTATION == 'CPython'
 IS_WIN = sys.platform == 'win32'
-IS_MAC_ARM64 = sys.platform == 'darwin' and platform.machine() == 'arm64'
+# os.uname is a direct syscall wrapper, unlike platform.machine which may fall back to spawning processes
+IS_MAC_ARM64 = sys.platform == 'darwin' and os.uname().machine == 'arm64'
 ROOT = os.path.realpath(os.path.join(os.path.abspath(__file__), os.path.pardir, os.path.pardir))
 IS_ZIPAPP = os.path.isfile(ROOT)
 _CAN_SYMLINK = _FS_CASE_SENSITIVE = _CFG_DIR = _DATA_DIR = None
@@ -50,6 +52,11 @@ def fs_is_case_sensitive():
 
 def fs_path_id(path):
     """Get a unique identifier for a path."""
+    # relative paths resolve against the working directory, so only their absolute form can be memoized
+    return _fs_path_id(os.fspath(path) if os.path.isabs(path) else os.path.abspath(path))
+
+@lru_cache(maxsize=4096)
+def _fs_path_id(path):
     if IS_WIN:
         # On Windows, the path is case-insensitive
         return os.path.normcase(os.path.abspath(path))
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from collections import OrderedDict, defaultdict
-from typing import TYPE_CHECKING, NamedTuple
+from collections import defaultdict
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 from virtualenv.create.describe import Describe
 from virtualenv.create.via_global_ref.builtin.builtin_way import VirtualenvBuiltin
 from .base import ComponentBuilder
@@ -14,15 +14,45 @@ class CreatorInfo(NamedTuple):
     builtin_key: str
 
 class CreatorSelector(ComponentBuilder):
+    _FOR_INTERPRETER_CACHE: ClassVar[dict[tuple, CreatorInfo]] = {}
+    _FOR_INTERPRETER_CACHE_MAX_SIZE: ClassVar[int] = 64
 
     def __init__(self, interpreter, parser) -> None:
         creators, self.key_to_meta, self.describe, self.builtin_key = self.for_interpreter(interpreter)
         super().__init__(interpreter, parser, 'creator', creators)
 
-    @staticmethod
-    def for_interpreter(interpreter):
+    @classmethod
+    def for_interpreter(cls, interpreter):
         """Find the available creators for the interpreter."""
-        key_to_class = OrderedDict()
+        key = (
+            interpreter.implementation,
+            interpreter.version_info,
+            interpreter.architecture,
+            interpreter.platform,
+            interpreter.system_executable,
+            interpreter.executable,
+        )
+        cache = cls._FOR_INTERPRETER_CACHE
+        if key in cache:
+            info = cache[key] = cache.pop(key)  # re-insert to mark the entry as the most recently used one
+        else:
+            info = cache[key] = cls._for_interpreter(interpreter)
+            if len(cache) > cls._FOR_INTERPRETER_CACHE_MAX_SIZE:
+                del cache[next(iter(cache))]
+        # hand out copies, so callers changing their result cannot alter what later callers get
+        return info._replace(
+            key_to_class=dict(info.key_to_class),
+            key_to_meta=defaultdict(list, {k: list(v) for k, v in info.key_to_meta.items()}),
+        )
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget the creators found for the interpreters seen so far."""
+        cls._FOR_INTERPRETER_CACHE.clear()
+
+    @staticmethod
+    def _for_interpreter(interpreter):
+        key_to_class = {}
         key_to_meta = defaultdict(list)
         describe = None
         builtin_key = None
@@ -42,6 +72,6 @@ class CreatorSelector(ComponentBuilder):
             key_to_class[builtin_key] = VirtualenvBuiltin
             key_to_meta[builtin_key] = []
 
-        return CreatorInfo(key_to_class, key_to_meta, describe, builtin_key)
+        return CreatorInfo(key_to_class, dict(key_to_meta), describe, builtin_key)
 
 __all__ = ['CreatorInfo', 'CreatorSelector']
\ No newline at end of file
@@ -5,5 +5,8 @@ from virtualenv.util.path import copy
 from .base import PipInstall
 
 class CopyPipInstall(PipInstall):
-    pass
+
+    def _sync(self, src, dst):
+        # the image holds freshly extracted wheel content, its timestamps carry no meaning worth the extra calls
+        copy(src, dst, preserve_stat=False)
 __all__ = ['CopyPipInstall']
\ No newline at end of file
@@ -1,13 +1,20 @@
 """Bootstrap."""
 from __future__ import annotations
+import atexit
 import logging
+import os
+import re
+import shutil
 import sys
+from functools import lru_cache
 from operator import eq, lt
 from pathlib import Path
-from subprocess import PIPE, CalledProcessError, Popen
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
+from tempfile import mkdtemp
+from virtualenv.app_data import AppDataDiskFolder
 from .bundle import from_bundle
 from .periodic_update import add_wheel_to_update_log
-from .util import Version, Wheel, discover_wheels
+from .util import Version, Wheel, _version_key, discover_wheel
 
 def pip_wheel_env_run(cmd, env=None):
     """Run pip wheel with the given command and environment."""
@@ -17,46 +24,84 @@ def pip_wheel_env_run(cmd, env=None):
     env['PIP_USE_WHEEL'] = '1'
     env['PIP_USER'] = '0'
     env['PIP_NO_INPUT'] = '1'
-    process = Popen(cmd, env=env, stdout=PIPE, stderr=PIPE, universal_newlines=True)
-    out, err = process.communicate()
+    # the output of pip is not needed, only its error report in case it fails
+    process = run(cmd, env=env, stdout=DEVNULL, stderr=PIPE, text=True, check=False)
     if process.returncode != 0:
-        raise CalledProcessError(process.returncode, cmd, out, err)
-    return out, err
+        raise CalledProcessError(process.returncode, cmd, None, process.stderr)
 
 def download_wheel(distribution, version, for_py_version, embed_filename, app_data, env, search_dirs):
     """Download a wheel from PyPI."""
-    cmd = [
-        sys.executable,
-        '-m',
-        'pip',
-        'wheel',
-        '--disable-pip-version-check',
-        '--no-deps',
-        '--no-cache-dir',
-        '--python-version',
-        for_py_version,
-        f'{distribution}=={version}',
-    ]
-    for search_dir in search_dirs:
-        cmd.extend(['--find-links', str(search_dir)])
-    out, _ = pip_wheel_env_run(cmd, env)
-    wheel_file = None
-    for line in out.splitlines():
-        if line.startswith('Saved '):
-            wheel_file = Path(line.split(' ')[-1])
-            break
-    if wheel_file is None or not wheel_file.exists():
-        return None
-    return wheel_file
+    return download_wheels([(distribution, version)], for_py_version, app_data, env, search_dirs).get(distribution)
+
+def download_wheels(distributions_versions, for_py_version, app_data, env, search_dirs):
+    """Download the wheels of multiple distributions from PyPI within one pip run, mapping distribution to path."""
+    house = _wheel_house(app_data)
+    # pip downloads into a fresh folder, so it holds exactly the requested wheels
+    staging = mkdtemp(prefix='virtualenv-wheel-')
+    try:
+        cmd = [
+            sys.executable,
+            '-m',
+            'pip',
+            'download',
+            '--progress-bar',
+            'off',
+            '--disable-pip-version-check',
+            '--only-binary=:all:',
+            '--no-deps',
+            '--no-cache-dir',
+            '--python-version',
+            for_py_version,
+            '--dest',
+            staging,
+        ]
+        cmd.extend(f'{distribution}=={version}' for distribution, version in distributions_versions)
+        for search_dir in search_dirs:
+            cmd.extend(['--find-links', str(search_dir)])
+        pip_wheel_env_run(cmd, env)
+        downloaded = {_canonical_name(Wheel(path).name): path for path in Path(staging).glob('*.whl')}
+        result = {}
+        for distribution, _ in distributions_versions:
+            path = downloaded.get(_canonical_name(distribution))
+            if path is not None:
+                result[distribution] = _move(path, house / path.name)
+        return result
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+def _wheel_house(app_data):
+    """The folder downloaded wheels are kept in, the house of the app data when it is on the disk and writable."""
+    if isinstance(app_data, AppDataDiskFolder) and app_data.can_update:
+        house = Path(str(app_data)) / 'wheel' / 'house'
+        house.mkdir(parents=True, exist_ok=True)
+        return house
+    return _process_wheel_house()
+
+@lru_cache(maxsize=1)
+def _process_wheel_house():
+    # without an app data folder the wheels are only needed by this process, remove them once it exits
+    folder = mkdtemp(prefix='virtualenv-wheel-house-')
+    atexit.register(shutil.rmtree, folder, ignore_errors=True)
+    return Path(folder)
+
+def _move(src, dest):
+    try:
+        os.replace(src, dest)
+    except OSError:  # e.g. the temporary folder lives on another device
+        shutil.copy2(src, dest)
+    return dest
+
+def _canonical_name(name):
+    # wheel file names escape the separators of the distribution name to underscores
+    return re.sub('[-_.]+', '_', name).lower()
 
 def get_wheel(distribution, version, for_py_version, search_dirs, download, app_data, do_periodic_update, env):
     """Get a wheel with the given distribution-version-for_py_version trio, by using the extra search dir + download."""
     # First try to find the wheel in the search directories
     for search_dir in search_dirs:
-        wheels = discover_wheels(search_dir, distribution)
-        for wheel in wheels:
-            if wheel.version == version:
-                return wheel.path
+        wheel = discover_wheel(search_dir, distribution, version)
+        if wheel is not None:
+            return wheel.path
 
     # If not found and download is allowed, try to download it
     if download:
@@ -64,7 +109,7 @@ def get_wheel(distribution, version, for_py_version, search_dirs, download, app_
         wheel_path = download_wheel(distribution, version, for_py_version, embed_filename, app_data, env, search_dirs)
         if wheel_path is not None:
             if do_periodic_update:
-                add_wheel_to_update_log(app_data.embed_update_log(distribution), Wheel(wheel_path), 'download')
+                add_wheel_to_update_log(app_data.embed_update_log(distribution), Wheel(wheel_path), 'download', app_data)
             return wheel_path
 
     # If still not found, try to get it from the bundle
@@ -86,6 +131,6 @@ def find_compatible_in_house(distribution, version, wheels):
 
     # If no exact match, try to find a compatible version
     # For now, we'll just return the latest version
-    return max(wheels, key=lambda w: w.version)
+    return max(wheels, key=_version_key)
 
-__all__ = ['download_wheel', 'find_compatible_in_house', 'get_wheel', 'pip_wheel_env_run']
\ No newline at end of file
+__all__ = ['download_wheel', 'download_wheels', 'find_compatible_in_house', 'get_wheel', 'pip_wheel_env_run']
\ No newline at end of file
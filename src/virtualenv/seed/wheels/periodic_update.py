@@ -1,19 +1,24 @@
 """Periodically update bundled versions."""
 from __future__ import annotations
+import gzip
 import json
 import logging
 import os
 import ssl
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from http import HTTPStatus
 from itertools import groupby
 from pathlib import Path
 from shutil import copy2
 from subprocess import DEVNULL, Popen
 from textwrap import dedent
 from threading import Thread
-from urllib.error import URLError
-from urllib.request import urlopen
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 from virtualenv.app_data import AppDataDiskFolder
 from virtualenv.seed.wheels.embed import BUNDLE_SUPPORT
 from virtualenv.seed.wheels.util import Wheel
@@ -23,6 +28,8 @@ GRACE_PERIOD_MINOR = timedelta(days=28)
 UPDATE_PERIOD = timedelta(days=14)
 UPDATE_ABORTED_DELAY = timedelta(hours=1)
 DATETIME_FMT = '%Y-%m-%dT%H:%M:%S.%fZ'
+PYPI_CACHE_TTL = timedelta(hours=1)
+_PYPI_MAX_WORKERS = 8
 
 class NewVersion:
 
@@ -58,26 +65,94 @@ def load_datetime(raw):
     """Convert string to datetime."""
     return None if raw is None else datetime.strptime(raw, DATETIME_FMT).replace(tzinfo=timezone.utc)
 
-def release_date_for_wheel_path(path):
+def _pypi_cache_file(app_data, name, version):
+    """Location of the on-disk copy of the PyPI metadata for a release, ``None`` if it is not persisted."""
+    if app_data is None or app_data.transient:
+        return None
+    return Path(str(app_data)) / 'pypi-cache' / f'{name}-{version}.json'
+
+def _load_pypi_cache(cache_file):
+    try:
+        if time.time() - cache_file.stat().st_mtime > PYPI_CACHE_TTL.total_seconds():
+            return None
+        with cache_file.open(encoding='utf-8') as file_handler:
+            return json.load(file_handler)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def _store_pypi_cache(cache_file, data):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write aside and swap in, so concurrent readers never see a partial file
+        temp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        temp_file.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(temp_file, cache_file)
+    except OSError as exception:
+        logging.debug('could not cache PyPI metadata to %s because %r', cache_file, exception)
+
+@lru_cache(maxsize=1)
+def _ssl_context():
+    """The verifying TLS context shared by all PyPI requests, built on first use as loading the CA store is costly."""
+    return ssl.create_default_context()
+
+def _pypi_get_json(url):
+    """Fetch a JSON document from PyPI, ``None`` if there is no such document; proxies and redirects are honoured."""
+    # the scheme is always https, the URL is built by the callers from the PyPI base
+    request = Request(url, headers={'Accept-Encoding': 'gzip'})  # noqa: S310
+    try:
+        with urlopen(request, timeout=10, context=_ssl_context()) as response:  # noqa: S310
+            body = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+    except HTTPError as exception:
+        if exception.code == HTTPStatus.NOT_FOUND:  # e.g. a local build never published
+            return None
+        raise
+    return json.loads(body)
+
+def release_date_for_wheel_path(path, app_data=None):
     """Get the release date for a wheel from PyPI."""
     wheel = Wheel.from_path(path)
-    if wheel.name not in _PYPI_CACHE:
-        url = f'https://pypi.org/pypi/{wheel.name}/json'
-        try:
-            with urlopen(url, timeout=10, context=ssl._create_unverified_context()) as file_handler:
-                _PYPI_CACHE[wheel.name] = json.load(file_handler)
-        except (URLError, json.JSONDecodeError):
-            return None
-    data = _PYPI_CACHE[wheel.name]
-    if wheel.version in data.get('releases', {}):
-        for release in data['releases'][wheel.version]:
-            if release['filename'] == wheel.filename:
-                return datetime.strptime(release['upload_time'], '%Y-%m-%dT%H:%M:%S')
-    return None
-
-def add_wheel_to_update_log(versions, wheel, source):
+    key = wheel.name, wheel.version
+    if key not in _PYPI_CACHE:
+        cache_file = _pypi_cache_file(app_data, *key)
+        upload_times = None if cache_file is None else _load_pypi_cache(cache_file)
+        if upload_times is None:
+            # the per release endpoint only carries the files of that version, a fraction of the full project payload
+            url = f'https://pypi.org/pypi/{wheel.name}/{wheel.version}/json'
+            try:
+                data = _pypi_get_json(url)
+            except Exception as exception:  # noqa: BLE001 # the release date is best effort, never fail the caller
+                logging.error('failed to access %s because %r', url, exception)  # noqa: TRY400
+                return None
+            if data is None:
+                return None
+            upload_times = {i['filename']: i['upload_time'] for i in data.get('urls', [])}
+            if cache_file is not None and app_data.can_update:
+                _store_pypi_cache(cache_file, upload_times)
+        _PYPI_CACHE[key] = upload_times
+    upload_time = _PYPI_CACHE[key].get(wheel.filename)
+    if upload_time is None:
+        return None
+    return datetime.strptime(upload_time, '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+
+def release_dates_for_wheels(paths, app_data=None):
+    """
+    Get the release dates for many wheels from PyPI, querying them concurrently.
+
+    The answers land in the PyPI cache too, so a follow-up :func:`add_wheel_to_update_log` for these wheels does not
+    hit the network again.
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(paths), _PYPI_MAX_WORKERS)) as executor:
+        release_dates = executor.map(partial(release_date_for_wheel_path, app_data=app_data), paths)
+        return dict(zip(paths, release_dates))
+
+def add_wheel_to_update_log(versions, wheel, source, app_data=None):
     """Add a wheel to the update log."""
-    release_date = release_date_for_wheel_path(wheel)
+    release_date = release_date_for_wheel_path(wheel.path, app_data)
     if release_date is not None:
         found_date = datetime.now(tz=timezone.utc)
         versions.append(NewVersion(wheel.name, found_date, release_date, source))
@@ -120,4 +195,4 @@ def periodic_update(distribution, for_py_version):
     if datetime.now(tz=timezone.utc) - completed > UPDATE_PERIOD:
         trigger_update(distribution, for_py_version)
 
-__all__ = ['NewVersion', 'UpdateLog', 'add_wheel_to_update_log', 'do_update', 'dump_datetime', 'load_datetime', 'manual_upgrade', 'periodic_update', 'release_date_for_wheel_path', 'trigger_update']
\ No newline at end of file
+__all__ = ['NewVersion', 'UpdateLog', 'add_wheel_to_update_log', 'do_update', 'dump_datetime', 'load_datetime', 'manual_upgrade', 'periodic_update', 'release_date_for_wheel_path', 'release_dates_for_wheels', 'trigger_update']
\ No newline at end of file
@@ -1,11 +1,23 @@
 from __future__ import annotations
-from operator import attrgetter
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
 from zipfile import ZipFile
 
+# {distribution}-{version}(-{build tag})?-{python tag}-{abi tag}-{platform tag}.whl, neither name nor version has a dash
+_WHEEL_RE = re.compile(r'^(?P<name>[^-]+)-(?P<version>[^-]+)(?:-.+)?\.whl$')
+
 class Wheel:
     def __init__(self, path) -> None:
         self.path = path
-        self._parts = path.stem.split('-')
+        match = _WHEEL_RE.match(path.name)
+        if match is None:
+            self._name, self._version = [*path.stem.split('-'), ''][:2]
+        else:
+            self._name, self._version = match.group('name', 'version')
+        self._version_tuple = None
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.path})'
@@ -16,12 +28,32 @@ class Wheel:
     @property
     def name(self):
         """Get the name of the wheel."""
-        return self._parts[0]
+        return self._name
 
     @property
     def version(self):
         """Get the version of the wheel."""
-        return self._parts[1]
+        return self._version
+
+    @property
+    def version_tuple(self):
+        """Get the version of the wheel as a tuple of integers, ordering numerically (``10.0`` after ``9.0``)."""
+        if self._version_tuple is None:
+            self._version_tuple = self.as_version_tuple(self.version)
+        return self._version_tuple
+
+    @staticmethod
+    def as_version_tuple(version):
+        """Convert the leading numeric parts of a version string to a tuple of integers."""
+        result = []
+        for part in version.split('.')[0:3]:
+            try:
+                result.append(int(part))
+            except ValueError:
+                break
+        if not result:
+            raise ValueError(version)
+        return tuple(result)
 
     @property
     def filename(self):
@@ -35,17 +67,55 @@ class Wheel:
 
 def discover_wheels(folder, distribution):
     """Discover wheels in a folder."""
-    wheels = []
-    for path in folder.iterdir():
-        if path.suffix == '.whl':
-            wheel = Wheel(path)
-            if wheel.name == distribution:
-                wheels.append(wheel)
-    return sorted(wheels, key=attrgetter('version'), reverse=True)
+    return list(_folder_wheels(os.fspath(folder), _wheel_names(folder), distribution))
+
+def discover_wheel(folder, distribution, version):
+    """Find the wheel of a distribution with an exact version in a folder, ``None`` if there is no such wheel."""
+    return _folder_versions(os.fspath(folder), _wheel_names(folder), distribution).get(version)
+
+def _wheel_names(folder):
+    """
+    The wheel file names within a folder.
+
+    Listing a folder is cheap, so this runs on every lookup and keys the caches below: unlike the folder modification
+    time it cannot miss a wheel added within the same timestamp tick.
+    """
+    with os.scandir(folder) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.name.endswith('.whl')))
+
+@lru_cache(maxsize=128)
+def _folder_versions(folder, names, distribution):
+    """Index the wheels of a distribution within a folder by version, an exact lookup needs no version ordering."""
+    versions = {}
+    for name in _group_by_distribution(names).get(distribution, ()):
+        wheel = Wheel(Path(os.path.join(folder, name)))
+        versions.setdefault(wheel.version, wheel)  # on duplicate versions (other tags) the first file name wins
+    return versions
+
+@lru_cache(maxsize=128)
+def _folder_wheels(folder, names, distribution):
+    """The wheels of a distribution within a folder, newest first; only these entries get a ``Path`` and ``Wheel``."""
+    paths = (os.path.join(folder, name) for name in _group_by_distribution(names).get(distribution, ()))
+    return tuple(sorted((Wheel(Path(i)) for i in paths), key=_version_key, reverse=True))
+
+def _version_key(wheel):
+    """Order wheels by version, those with a version that is not numeric (e.g. a ``main`` build) below any release."""
+    try:
+        return True, wheel.version_tuple
+    except ValueError:
+        return False, ()
+
+@lru_cache(maxsize=128)
+def _group_by_distribution(names):
+    """Group wheel file names by their distribution name."""
+    groups = defaultdict(list)
+    for name in names:
+        groups[name.split('-', 1)[0]].append(name)
+    return dict(groups)
 
 class Version:
     bundle = 'bundle'
     embed = 'embed'
     non_version = (bundle, embed)
 
-__all__ = ['Version', 'Wheel', 'discover_wheels']
\ No newline at end of file
+__all__ = ['Version', 'Wheel', 'discover_wheel', 'discover_wheels']
\ No newline at end of file
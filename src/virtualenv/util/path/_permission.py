@@ -1,6 +1,9 @@
 from __future__ import annotations
 import os
 from stat import S_IXGRP, S_IXOTH, S_IXUSR
+from ._sync import _thread_map
+# resolve entry names against an open folder handle, rather than the full path from the root every time
+_CHMOD_DIR_FD = os.chmod in os.supports_dir_fd and os.scandir in os.supports_fd
 
 def make_exe(filename):
     """Make a file executable by setting executable bits."""
@@ -13,11 +16,45 @@ def set_tree(folder, mode):
     """Set permissions recursively on a directory tree."""
     if not os.path.exists(folder):
         return
-    os.chmod(folder, mode)
-    for root, dirs, files in os.walk(folder):
-        for directory in dirs:
-            os.chmod(os.path.join(root, directory), mode)
-        for file in files:
-            os.chmod(os.path.join(root, file), mode)
+    if not os.path.isdir(folder):
+        os.chmod(folder, mode)
+        return
+    if _CHMOD_DIR_FD:
+        dir_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for parent_fd, name, _ in _walk_entries(dir_fd):
+                os.chmod(name, mode, dir_fd=parent_fd)
+        finally:
+            os.close(dir_fd)
+        os.chmod(folder, mode)
+        return
+    folders, files = [folder], []
+    for root, dirs, names in os.walk(folder):
+        folders.extend(os.path.join(root, name) for name in dirs)
+        files.extend((os.path.join(root, name), mode) for name in names)
+    _thread_map(os.chmod, files)
+    # folders last and deepest first, so a restrictive mode never blocks reaching the entries below it
+    for path in reversed(folders):
+        os.chmod(path, mode)
+
+def _walk_entries(dir_fd):
+    """
+    Walk everything below the folder opened as ``dir_fd``, each folder after its content.
+
+    Symbolic links are reported but not followed.
+
+    Yields:
+        ``(parent_fd, name, is_dir)`` per entry, ``name`` being relative to the open folder ``parent_fd``.
+    """
+    with os.scandir(dir_fd) as entries:
+        for entry in entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                child_fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=dir_fd)
+                try:
+                    yield from _walk_entries(child_fd)
+                finally:
+                    os.close(child_fd)
+            yield dir_fd, entry.name, is_dir
 
 __all__ = ('make_exe', 'set_tree')
\ No newline at end of file
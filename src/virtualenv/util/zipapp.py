@@ -1,28 +1,88 @@
 from __future__ import annotations
 import logging
 import os
+import shutil
+import threading
 import zipfile
+from contextlib import suppress
+from functools import partial
 from virtualenv.info import IS_WIN, ROOT
+from virtualenv.util.path._sync import _thread_map
+_COPY_BUFFER_SIZE = 1024 * 1024
+_OPEN_DIR_FD = {os.open, os.mkdir} <= os.supports_dir_fd
 
 def extract(filename, dest):
     """Extract a zip file to a destination directory."""
-    if not os.path.exists(dest):
-        os.makedirs(dest)
-    with zipfile.ZipFile(filename) as zip_file:
-        for info in zip_file.infolist():
-            name = info.filename
-            # Skip directories
-            if name.endswith('/'):
-                continue
-            # Convert forward slashes to backslashes on Windows
-            if IS_WIN:
-                name = name.replace('/', os.sep)
-            target = os.path.join(dest, name)
-            # Create parent directories if they don't exist
-            os.makedirs(os.path.dirname(target), exist_ok=True)
-            # Extract the file
-            with zip_file.open(info) as source, open(target, 'wb') as target_file:
-                target_file.write(source.read())
+    os.makedirs(dest, exist_ok=True)
+    dir_fd = os.open(dest, os.O_RDONLY | os.O_DIRECTORY) if _OPEN_DIR_FD else None
+    try:
+        with zipfile.ZipFile(filename) as zip_file:
+            members = []
+            for info in zip_file.infolist():
+                name = info.filename
+                # Skip directories
+                if name.endswith('/'):
+                    continue
+                # Convert forward slashes to backslashes on Windows
+                if IS_WIN:
+                    name = name.replace('/', os.sep)
+                members.append((info, name if dir_fd is not None else os.path.join(dest, name), dir_fd))
+            _make_parents({os.path.dirname(target) for _, target, _ in members}, dir_fd)
+            _extract_members(filename, zip_file, members)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+def _make_parents(folders, dir_fd):
+    # Create every parent directory once, instead of once per member
+    if dir_fd is None:
+        for folder in folders:
+            os.makedirs(folder, exist_ok=True)
+        return
+    # relative to the destination handle every ancestor needs its own mkdir, shallowest first
+    ancestors = set()
+    for folder in folders:
+        parent = folder
+        while parent and parent not in ancestors:
+            ancestors.add(parent)
+            parent = os.path.dirname(parent)
+    for folder in sorted(ancestors, key=lambda i: i.count(os.sep)):
+        with suppress(FileExistsError):
+            os.mkdir(folder, dir_fd=dir_fd)
+
+def _extract_members(filename, zip_file, members):
+    # a zip file handle seeks on every read, so each worker thread reads through a handle of its own
+    local = threading.local()
+    local.zip_file = zip_file  # few members are extracted on the calling thread, through the handle already open
+    handles = []
+
+    def extract_one(info, target, dir_fd):
+        handle = getattr(local, 'zip_file', None)
+        if handle is None:
+            handle = local.zip_file = zipfile.ZipFile(filename)
+            handles.append(handle)
+        _extract_member(handle, info, target, dir_fd)
+
+    try:
+        # decompression and writes release the GIL, so threads overlap them
+        _thread_map(extract_one, members)
+    finally:
+        for handle in handles:
+            handle.close()
+
+def _extract_member(zip_file, info, target, dir_fd=None):
+    if info.file_size <= _COPY_BUFFER_SIZE:
+        # most members are small, inflate them in one go and hand the kernel a single write
+        content = zip_file.read(info)
+        with open(target, 'wb', opener=partial(_open_at, dir_fd)) as target_file:
+            target_file.write(content)
+        return
+    # Stream the member through a fixed buffer, rather than reading it fully into memory
+    with zip_file.open(info) as source, open(target, 'wb', opener=partial(_open_at, dir_fd)) as target_file:
+        shutil.copyfileobj(source, target_file, _COPY_BUFFER_SIZE)
+
+def _open_at(dir_fd, path, flags):
+    return os.open(path, flags, 0o666, dir_fd=dir_fd)
 
 def read(filename):
     """Read a file from a zip file."""
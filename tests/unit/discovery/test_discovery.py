@@ -9,8 +9,9 @@ from uuid import uuid4
 
 import pytest
 
-from virtualenv.discovery.builtin import Builtin, get_interpreter
+from virtualenv.discovery.builtin import Builtin, get_interpreter, path_exe_finder
 from virtualenv.discovery.py_info import PythonInfo
+from virtualenv.discovery.py_spec import PythonSpec
 from virtualenv.info import fs_supports_symlink
 
 
@@ -91,3 +92,17 @@ def test_discovery_fallback_ok(session_app_data, caplog):
     assert result.executable == sys.executable, caplog.text
 
     assert "accepted" in caplog.text
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX executable bits")
+def test_path_exe_finder_skips_non_executables(tmp_path):
+    (tmp_path / "python3").mkdir()
+    (tmp_path / "python3.12").write_text("", encoding="utf-8")
+    executable = tmp_path / "python3.11"
+    executable.write_text("", encoding="utf-8")
+    executable.chmod(0o700)
+    (tmp_path / "pip3").write_text("", encoding="utf-8")
+
+    finder = path_exe_finder(PythonSpec("python3", None, 3, None, None, None, None))
+
+    assert list(finder(str(tmp_path))) == [(str(executable), True)]
@@ -113,3 +113,12 @@ def test_relative_spec(tmp_path, monkeypatch):
     a_relative_path = str((tmp_path / "a" / "b").relative_to(tmp_path))
     spec = PythonSpec.from_string_spec(a_relative_path)
     assert spec.path == a_relative_path
+
+
+def test_generate_re_shared_between_equal_specs():
+    spec_1 = PythonSpec("python3.12", None, 3, 12, None, None, None)
+    spec_2 = PythonSpec("python3.12-64", None, 3, 12, None, 64, None)
+    pattern = spec_1.generate_re(windows=False)
+    assert pattern is spec_2.generate_re(windows=False)
+    assert pattern is not spec_1.generate_re(windows=True)
+    assert pattern.match("python3.12")
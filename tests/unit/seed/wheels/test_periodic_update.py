@@ -4,10 +4,9 @@ import json
 import os
 import subprocess
 import sys
+import threading
 from collections import defaultdict
-from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from io import StringIO
 from itertools import zip_longest
 from pathlib import Path
 from textwrap import dedent
@@ -28,6 +27,7 @@ from virtualenv.seed.wheels.periodic_update import (
     manual_upgrade,
     periodic_update,
     release_date_for_wheel_path,
+    release_dates_for_wheels,
     trigger_update,
 )
 from virtualenv.util.subprocess import CREATE_NO_WINDOW
@@ -402,20 +402,24 @@ def test_do_update_first(tmp_path, mocker, time_freeze):
 
     download_wheel = mocker.patch("virtualenv.seed.wheels.acquire.download_wheel", side_effect=_download_wheel)
     releases = {
-        Wheel(Path(wheel)).version: [
-            {"upload_time": datetime.strftime(release_date, "%Y-%m-%dT%H:%M:%S") if release_date is not None else None},
-        ]
+        Wheel(Path(wheel)).version: {
+            "urls": [
+                {
+                    "filename": Path(wheel).name,
+                    "upload_time": None
+                    if release_date is None
+                    else datetime.strftime(release_date, "%Y-%m-%dT%H:%M:%S"),
+                },
+            ],
+        }
         for wheel, release_date in pip_version_remote
     }
-    pypi_release = json.dumps({"releases": releases})
 
-    @contextmanager
-    def _release(of, context):
-        assert of == "https://pypi.org/pypi/pip/json"
-        assert context is None
-        yield StringIO(pypi_release)
+    def _release(url):
+        assert url.startswith("https://pypi.org/pypi/pip/")
+        return releases[url.split("/")[-2]]
 
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=_release)
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=_release)
 
     last_update = _UP_NOW - timedelta(days=14)
     u_log = UpdateLog(started=last_update, completed=last_update, versions=[], periodic=True)
@@ -426,7 +430,7 @@ def test_do_update_first(tmp_path, mocker, time_freeze):
     versions = do_update("pip", "3.9", str(pip_version_remote[-1][0]), str(app_data_outer), [str(extra)], True)
 
     assert download_wheel.call_count == len(pip_version_remote)
-    assert url_o.call_count == 1
+    assert url_o.call_count == len(pip_version_remote)
     assert copy.call_count == 1
 
     expected = [
@@ -465,7 +469,7 @@ def test_do_update_skip_already_done(tmp_path, mocker, time_freeze):
         return wheel.path
 
     download_wheel = mocker.patch("virtualenv.seed.wheels.acquire.download_wheel", side_effect=_download_wheel)
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=RuntimeError)
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=RuntimeError)
 
     released = _UP_NOW - timedelta(days=30)
     u_log = UpdateLog(
@@ -516,29 +520,44 @@ def test_new_version_ne():
     )
 
 
-def test_get_release_unsecure(mocker, caplog):
-    @contextmanager
-    def _release(of, context):
-        assert of == "https://pypi.org/pypi/pip/json"
-        if context is None:
-            msg = "insecure"
-            raise URLError(msg)
-        assert context
-        yield StringIO(json.dumps({"releases": {"20.1": [{"upload_time": "2020-12-22T12:12:12"}]}}))
+def test_get_release(mocker):
+    def _release(url):
+        assert url == "https://pypi.org/pypi/pip/20.1/json"
+        return {"urls": [{"filename": "pip-20.1.whl", "upload_time": "2020-12-22T12:12:12"}]}
 
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=_release)
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=_release)
 
     result = release_date_for_wheel_path(Path("pip-20.1.whl"))
 
     assert result == datetime(year=2020, month=12, day=22, hour=12, minute=12, second=12, tzinfo=timezone.utc)
-    assert url_o.call_count == 2
-    assert "insecure" in caplog.text
-    assert " failed " in caplog.text
+    assert url_o.call_count == 1
+
+
+def test_release_dates_for_wheels_fills_cache(mocker):
+    from virtualenv.seed.wheels.periodic_update import _PYPI_CACHE  # noqa: PLC0415
+
+    barrier = threading.Barrier(3, timeout=10)
+
+    def _release(url):
+        barrier.wait()  # only passes if all three queries are in flight at the same time
+        name, version = url.split("/")[-3:-1]
+        return {"urls": [{"filename": f"{name}-{version}.whl", "upload_time": "2020-12-22T12:12:12"}]}
+
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=_release)
+    paths = [Path(f"{name}-1.0.whl") for name in ("pip", "setuptools", "wheel")]
+
+    result = release_dates_for_wheels(paths)
+
+    released = datetime(year=2020, month=12, day=22, hour=12, minute=12, second=12, tzinfo=timezone.utc)
+    assert result == dict.fromkeys(paths, released)
+    assert set(_PYPI_CACHE) == {("pip", "1.0"), ("setuptools", "1.0"), ("wheel", "1.0")}
+    assert release_date_for_wheel_path(paths[0]) == released
+    assert url_o.call_count == 3
 
 
 def test_get_release_fails(mocker, caplog):
     exc = RuntimeError("oh no")
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=exc)
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=exc)
 
     result = release_date_for_wheel_path(Path("pip-20.1.whl"))
 
@@ -569,7 +588,7 @@ def test_download_stop_with_embed(tmp_path, mocker, time_freeze):
     pip_version_remote = [wheel_path(wheel, (0, 0, 2)), wheel_path(wheel, (0, 0, 1)), wheel_path(wheel, (-1, 0, 0))]
 
     download_wheel = mock_download(mocker, pip_version_remote)
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=URLError("unavailable"))
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=URLError("unavailable"))
 
     last_update = _UP_NOW - timedelta(days=14)
     u_log = UpdateLog(started=last_update, completed=last_update, versions=[], periodic=True)
@@ -592,7 +611,7 @@ def test_download_manual_stop_after_one_download(tmp_path, mocker, time_freeze):
     pip_version_remote = [wheel_path(wheel, (0, 1, 1))]
 
     download_wheel = mock_download(mocker, pip_version_remote)
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=URLError("unavailable"))
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=URLError("unavailable"))
 
     last_update = _UP_NOW - timedelta(days=14)
     u_log = UpdateLog(started=last_update, completed=last_update, versions=[], periodic=True)
@@ -615,7 +634,7 @@ def test_download_manual_ignores_pre_release(tmp_path, mocker, time_freeze):
     pip_version_pre = NewVersion(Path(wheel_path(wheel, (0, 1, 0), "b1")).name, _UP_NOW, None, "downloaded")
 
     download_wheel = mock_download(mocker, pip_version_remote)
-    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update.urlopen", side_effect=URLError("unavailable"))
+    url_o = mocker.patch("virtualenv.seed.wheels.periodic_update._pypi_get_json", side_effect=URLError("unavailable"))
 
     last_update = _UP_NOW - timedelta(days=14)
     u_log = UpdateLog(started=last_update, completed=last_update, versions=[pip_version_pre], periodic=True)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from virtualenv.seed.wheels.embed import MAX, get_embed_wheel
-from virtualenv.seed.wheels.util import Wheel
+from virtualenv.seed.wheels.util import Wheel, discover_wheel, discover_wheels
 
 
 def test_wheel_support_no_python_requires(mocker):
@@ -29,3 +31,47 @@ def test_wheel_not_support():
 def test_wheel_repr():
     wheel = get_embed_wheel("setuptools", MAX)
     assert str(wheel.path) in repr(wheel)
+
+
+def test_discover_wheels_orders_versions_numerically(tmp_path):
+    for version in ("9.0.1", "10.0", "9.1"):
+        (tmp_path / f"pip-{version}-py3-none-any.whl").touch()
+    (tmp_path / "setuptools-70.0-py3-none-any.whl").touch()
+
+    wheels = discover_wheels(tmp_path, "pip")
+
+    assert [wheel.version for wheel in wheels] == ["10.0", "9.1", "9.0.1"]
+
+
+def test_discover_wheel_by_exact_version(tmp_path):
+    for version in ("9.0.1", "10.0"):
+        (tmp_path / f"pip-{version}-py3-none-any.whl").touch()
+
+    assert discover_wheel(tmp_path, "pip", "10.0").path == tmp_path / "pip-10.0-py3-none-any.whl"
+    assert discover_wheel(tmp_path, "pip", "9.0") is None
+    assert discover_wheel(tmp_path, "setuptools", "10.0") is None
+
+
+def test_discover_wheels_sees_wheel_added_within_same_mtime(tmp_path):
+    (tmp_path / "pip-9.0-py3-none-any.whl").touch()
+    stat = tmp_path.stat()
+    assert [wheel.version for wheel in discover_wheels(tmp_path, "pip")] == ["9.0"]
+
+    (tmp_path / "pip-10.0-py3-none-any.whl").touch()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert [wheel.version for wheel in discover_wheels(tmp_path, "pip")] == ["10.0", "9.0"]
+
+
+def test_discover_wheels_orders_non_numeric_versions_last(tmp_path):
+    for version in ("main", "23.0", "9.0"):
+        (tmp_path / f"pip-{version}-py3-none-any.whl").touch()
+
+    assert [wheel.version for wheel in discover_wheels(tmp_path, "pip")] == ["23.0", "9.0", "main"]
+
+
+def test_discover_wheel_ignores_non_numeric_versions(tmp_path):
+    (tmp_path / "pip-main-py3-none-any.whl").touch()
+    (tmp_path / "pip-23.0-py3-none-any.whl").touch()
+
+    assert discover_wheel(tmp_path, "pip", "23.0").path == tmp_path / "pip-23.0-py3-none-any.whl"
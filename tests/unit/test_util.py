@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import concurrent.futures
+import os
+import stat
+import sys
 import traceback
+import zipfile
 
 import pytest
 
+from virtualenv.util import zipapp
 from virtualenv.util.lock import ReentrantFileLock
+from virtualenv.util.path import _permission, safe_delete, set_tree, symlink
+from virtualenv.util.path._permission import _CHMOD_DIR_FD, _walk_entries
 from virtualenv.util.subprocess import run_cmd
 
 
@@ -34,3 +41,91 @@ def test_reentrant_file_lock_is_thread_safe(tmp_path):
                 task.result()
             except Exception:  # noqa: BLE001, PERF203
                 pytest.fail(traceback.format_exc())
+
+
+@pytest.mark.parametrize("count", [3, 40], ids=["serial", "parallel"])
+@pytest.mark.parametrize("dir_fd", [True, False], ids=["dir_fd", "path"])
+def test_zipapp_extract(tmp_path, monkeypatch, count, dir_fd):
+    if dir_fd and not zipapp._OPEN_DIR_FD:  # noqa: SLF001
+        pytest.skip("no dir_fd support")
+    monkeypatch.setattr(zipapp, "_OPEN_DIR_FD", dir_fd)
+    members = {f"pkg/sub{i % 4}/deep/m{i}.py": f"value = {i}\n".encode() for i in range(count)}
+    members["top.txt"] = b""
+    members["pkg/big.bin"] = os.urandom(zipapp._COPY_BUFFER_SIZE + 1)  # noqa: SLF001
+    archive = tmp_path / "a.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("pkg/", b"")
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+
+    zipapp.extract(archive, tmp_path / "out")
+
+    for name, content in members.items():
+        assert (tmp_path / "out" / name).read_bytes() == content
+
+
+def test_safe_delete(tmp_path):
+    folder = tmp_path / "folder"
+    (folder / "sub").mkdir(parents=True)
+    (folder / "sub" / "file").write_text("a", encoding="utf-8")
+    file = tmp_path / "file"
+    file.write_text("b", encoding="utf-8")
+
+    safe_delete(file)
+    safe_delete(tmp_path / "missing")
+    assert not file.exists()
+
+    if sys.platform != "win32":
+        folder_link, dangling = tmp_path / "folder_link", tmp_path / "dangling"
+        folder_link.symlink_to(folder, target_is_directory=True)
+        dangling.symlink_to(tmp_path / "missing")
+        safe_delete(folder_link)
+        safe_delete(dangling)
+        assert not os.path.lexists(folder_link)
+        assert not os.path.lexists(dangling)
+        assert (folder / "sub" / "file").exists()  # the link goes, not what it points to
+
+    safe_delete(folder)
+    assert not folder.exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+def test_symlink_replaces_existing(tmp_path):
+    dest = tmp_path / "link"
+    symlink("a", dest)
+    symlink("b", dest)
+    assert os.readlink(dest) == "b"
+
+
+@pytest.mark.parametrize("dir_fd", [True, False], ids=["dir_fd", "walk"])
+def test_set_tree(tmp_path, monkeypatch, dir_fd):
+    if dir_fd and not _CHMOD_DIR_FD:
+        pytest.skip("no dir_fd support")
+    monkeypatch.setattr(_permission, "_CHMOD_DIR_FD", dir_fd)
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c.txt").write_text("c", encoding="utf-8")
+    (tmp_path / "d.txt").write_text("d", encoding="utf-8")
+
+    set_tree(tmp_path / "a", 0o700)
+    set_tree(tmp_path / "d.txt", 0o600)
+
+    for path in (tmp_path / "a", tmp_path / "a" / "b", tmp_path / "a" / "b" / "c.txt"):
+        assert stat.S_IMODE(path.stat().st_mode) == 0o700
+    assert stat.S_IMODE((tmp_path / "d.txt").stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(not _CHMOD_DIR_FD, reason="no dir_fd support")
+def test_walk_entries_yields_folders_after_their_content(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c.txt").touch()
+    (tmp_path / "a" / "d.txt").touch()
+
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        order = [(name, is_dir) for _, name, is_dir in _walk_entries(dir_fd)]
+    finally:
+        os.close(dir_fd)
+
+    assert sorted(order) == [("a", True), ("b", True), ("c.txt", False), ("d.txt", False)]
+    assert order.index(("c.txt", False)) < order.index(("b", True)) < order.index(("a", True))
+    assert order.index(("d.txt", False)) < order.index(("a", True))